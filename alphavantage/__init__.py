@@ -7,6 +7,7 @@ A Python client for the Alpha Vantage API.
 
 __version__ = "0.1.0"
 
+from .cache import FileCache
 from .client import AlphaVantageClient
 from .exceptions import (
     AlphaVantageError,
@@ -24,14 +25,19 @@ from .models import (
     NewsSentimentResponse,
     TopGainersLosers,
 )
+from .ratelimit import RateLimiter
 
+# AsyncAlphaVantageClient is deliberately left out: it is resolved lazily by
+# __getattr__ below, and star-imports must not require the optional httpx
 __all__ = [
     "AlphaVantageClient",
+    "FileCache",
     "AlphaVantageError",
     "APIError",
     "APIKeyError",
     "InvalidParameterError",
     "RateLimitError",
+    "RateLimiter",
     "BalanceSheet",
     "CashFlow",
     "CompanyOverview",
@@ -39,4 +45,13 @@ __all__ = [
     "IncomeStatement",
     "NewsSentimentResponse",
     "TopGainersLosers",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # The async client depends on the optional httpx package, so it is only
+    # imported when it is actually requested.
+    if name == "AsyncAlphaVantageClient":
+        from .client_async import AsyncAlphaVantageClient
+        return AsyncAlphaVantageClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+"""
+Declarations of the endpoint methods generated from ``_ENDPOINTS``, for type checkers.
+
+Generated by scripts/generate_endpoint_stubs.py; do not edit, run ``make stubs``.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+import pyarrow as pa
+
+from .endpoints import SeriesRows
+from .models import (
+    BalanceSheet,
+    CashFlow,
+    CompanyOverview,
+    Earnings,
+    IncomeStatement,
+    NewsSentimentResponse,
+    TopGainersLosers,
+)
+
+
+class SyncEndpoints:
+    def get_time_series_daily(self, symbol: str, outputsize: str = "compact", datatype: str = "json", stream: bool = False) -> Union[Dict[str, Any], pa.Table, SeriesRows]: ...
+    def get_time_series_daily_adjusted(self, symbol: str, outputsize: str = "compact", datatype: str = "json", stream: bool = False) -> Union[Dict[str, Any], pa.Table, SeriesRows]: ...
+    def get_time_series_weekly(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_time_series_weekly_adjusted(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_time_series_monthly(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_time_series_monthly_adjusted(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_company_overview(self, symbol: str) -> CompanyOverview: ...
+    def get_income_statement(self, symbol: str) -> IncomeStatement: ...
+    def get_balance_sheet(self, symbol: str) -> BalanceSheet: ...
+    def get_cash_flow(self, symbol: str) -> CashFlow: ...
+    def get_earnings(self, symbol: str) -> Earnings: ...
+    def get_news_sentiment(self, tickers: Optional[str] = None, topics: Optional[str] = None, time_from: Optional[str] = None, time_to: Optional[str] = None, sort: str = "LATEST", limit: int = 50) -> NewsSentimentResponse: ...
+    def get_top_gainers_losers(self) -> TopGainersLosers: ...
+    def get_forex_intraday(self, from_symbol: str, to_symbol: str, interval: str = "5min", outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_forex_daily(self, from_symbol: str, to_symbol: str, outputsize: str = "compact", datatype: str = "json", stream: bool = False) -> Union[Dict[str, Any], pa.Table, SeriesRows]: ...
+    def get_forex_weekly(self, from_symbol: str, to_symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_forex_monthly(self, from_symbol: str, to_symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_crypto_intraday(self, symbol: str, market: str, interval: str = "5min", outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_crypto_daily(self, symbol: str, market: str, outputsize: str = "compact", datatype: str = "json", stream: bool = False) -> Union[Dict[str, Any], pa.Table, SeriesRows]: ...
+    def get_crypto_weekly(self, symbol: str, market: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    def get_crypto_monthly(self, symbol: str, market: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+
+class AsyncEndpoints:
+    async def get_time_series_daily(self, symbol: str, outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_time_series_daily_adjusted(self, symbol: str, outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_time_series_weekly(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_time_series_weekly_adjusted(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_time_series_monthly(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_time_series_monthly_adjusted(self, symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_company_overview(self, symbol: str) -> CompanyOverview: ...
+    async def get_income_statement(self, symbol: str) -> IncomeStatement: ...
+    async def get_balance_sheet(self, symbol: str) -> BalanceSheet: ...
+    async def get_cash_flow(self, symbol: str) -> CashFlow: ...
+    async def get_earnings(self, symbol: str) -> Earnings: ...
+    async def get_news_sentiment(self, tickers: Optional[str] = None, topics: Optional[str] = None, time_from: Optional[str] = None, time_to: Optional[str] = None, sort: str = "LATEST", limit: int = 50) -> NewsSentimentResponse: ...
+    async def get_top_gainers_losers(self) -> TopGainersLosers: ...
+    async def get_forex_intraday(self, from_symbol: str, to_symbol: str, interval: str = "5min", outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_forex_daily(self, from_symbol: str, to_symbol: str, outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_forex_weekly(self, from_symbol: str, to_symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_forex_monthly(self, from_symbol: str, to_symbol: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_crypto_intraday(self, symbol: str, market: str, interval: str = "5min", outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_crypto_daily(self, symbol: str, market: str, outputsize: str = "compact", datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_crypto_weekly(self, symbol: str, market: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
+    async def get_crypto_monthly(self, symbol: str, market: str, datatype: str = "json") -> Union[Dict[str, Any], pa.Table]: ...
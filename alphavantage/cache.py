@@ -0,0 +1,130 @@
+"""On-disk response cache for the Alpha Vantage API client."""
+
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Endpoints whose data only changes with a new filing or once a day
+_FUNDAMENTAL_TTL = 24 * 60 * 60
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "OVERVIEW": _FUNDAMENTAL_TTL,
+    "INCOME_STATEMENT": _FUNDAMENTAL_TTL,
+    "BALANCE_SHEET": _FUNDAMENTAL_TTL,
+    "CASH_FLOW": _FUNDAMENTAL_TTL,
+    "EARNINGS": _FUNDAMENTAL_TTL,
+    "NEWS_SENTIMENT": 5 * 60,
+    "TOP_GAINERS_LOSERS": 60,
+}
+
+# Fallback TTLs matched against the function name, checked in order
+_PATTERN_TTLS: Tuple[Tuple[str, float], ...] = (
+    ("INTRADAY", 5 * 60),
+    ("MONTHLY", 12 * 60 * 60),
+    ("WEEKLY", 12 * 60 * 60),
+    ("DAILY", 60 * 60),
+)
+
+
+class FileCache:
+    """
+    File-based cache of raw API responses with a TTL per endpoint.
+
+    Responses are stored as ``{directory}/{function}/{md5(params)}.json`` and are
+    considered fresh while the file's modification time is within the TTL of the
+    endpoint. Endpoints without a TTL are never cached.
+
+    Args:
+        directory (str, optional): Directory to store cached responses in. Defaults to ``.cache``.
+        ttls (dict, optional): Per-function TTLs in seconds, overriding the defaults.
+    """
+
+    def __init__(
+        self,
+        directory: str = ".cache",
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.directory = directory
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+    def ttl_for(self, function: str) -> Optional[float]:
+        """
+        Get the TTL for an API function.
+
+        Args:
+            function: The API function name
+
+        Returns:
+            TTL in seconds, or None if responses for the function should not be cached
+        """
+        if function in self.ttls:
+            return self.ttls[function]
+        for pattern, ttl in _PATTERN_TTLS:
+            if pattern in function:
+                return ttl
+        return None
+
+    def _path(self, function: str, params: Dict[str, Any]) -> str:
+        # The API key does not change the response, so it is left out of the key
+        query = "&".join(
+            f"{key}={value}" for key, value in sorted(params.items()) if key != "apikey"
+        )
+        digest = hashlib.md5(query.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, function, f"{digest}.json")
+
+    def get(self, function: str, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Get a cached response body.
+
+        Args:
+            function: The API function name
+            params: The request parameters
+
+        Returns:
+            The cached response body, or None on a miss or if the entry has expired
+        """
+        ttl = self.ttl_for(function)
+        if ttl is None:
+            return None
+        path = self._path(function, params)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, "rb") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def set(self, function: str, params: Dict[str, Any], content: bytes) -> None:
+        """
+        Store a response body.
+
+        Args:
+            function: The API function name
+            params: The request parameters
+            content: The raw response body
+        """
+        if self.ttl_for(function) is None:
+            return
+        path = self._path(function, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        for root, _, files in os.walk(self.directory, topdown=False):
+            for name in files:
+                if name.endswith(".json"):
+                    os.unlink(os.path.join(root, name))
@@ -1,12 +1,55 @@
 """Alpha Vantage API Client implementation."""
 
 import os
+import json
 import logging
-from typing import Any, Dict, Optional
+import functools
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import requests
-from dotenv import load_dotenv
-from pprint import pprint
+from pydantic import BaseModel, ValidationError
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ._endpoint_stubs import SyncEndpoints as _EndpointMethods
+else:
+    # The endpoint methods are attached at the bottom of this module; type checkers
+    # see them through the generated stub instead
+    _EndpointMethods = object
+
+from .cache import FileCache
+from .endpoints import (
+    _DATATYPES,
+    _ENDPOINTS,
+    _INTRADAY_INTERVALS,
+    _OUTPUT_SIZES,
+    EndpointSpec,
+    SeriesRows,
+    bind_params,
+    endpoint_docstring,
+    endpoint_signature,
+)
 from .exceptions import APIError, APIKeyError, InvalidParameterError, RateLimitError
 from .models import (
     BalanceSheet,
@@ -14,9 +57,8 @@ from .models import (
     CompanyOverview,
     Earnings,
     IncomeStatement,
-    NewsSentimentResponse,
-    TopGainersLosers,
 )
+from .ratelimit import RateLimiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,23 +69,262 @@ console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+if not logger.handlers:
+    logger.addHandler(console_handler)
+
+
+def _find_dotenv() -> Optional[str]:
+    """Find the nearest .env file, searching from the working directory upwards."""
+    directory = os.getcwd()
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+# Escape sequences recognised inside double-quoted .env values
+_DOTENV_ESCAPES = {'"': '"', "\\": "\\", "n": "\n", "t": "\t"}
+
+
+def _unquote_dotenv_value(value: str) -> Optional[str]:
+    """
+    Return the contents of a quoted .env value, or None if it is unterminated.
+
+    Double-quoted values understand ``\\"``, ``\\\\``, ``\\n`` and ``\\t``; any other
+    backslash is kept as-is. Single-quoted values are taken literally. Anything
+    after the closing quote (such as a comment) is ignored.
+    """
+    quote = value[0]
+    chars = []
+    i = 1
+    while i < len(value):
+        char = value[i]
+        if char == "\\" and quote == '"' and value[i + 1:i + 2] in _DOTENV_ESCAPES:
+            chars.append(_DOTENV_ESCAPES[value[i + 1]])
+            i += 2
+            continue
+        if char == quote:
+            return "".join(chars)
+        chars.append(char)
+        i += 1
+    return None
+
+
+def _parse_dotenv_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a single .env line.
+
+    Args:
+        line: Raw line from the .env file
+
+    Returns:
+        Optional[Tuple[str, str]]: The variable name and value, or None for blank
+        lines, comments and lines that do not assign a variable
+    """
+    line = line.strip()
+    if not line or line.startswith("#") or "=" not in line:
+        return None
+    key, _, value = line.partition("=")
+    key = key.strip()
+    if key.startswith("export "):
+        key = key[len("export "):].strip()
+    if not key:
+        logger.warning("Skipping .env line without a variable name: %s", line)
+        return None
+    value = value.strip()
+    if value[:1] in ("'", '"'):
+        unquoted = _unquote_dotenv_value(value)
+        if unquoted is not None:
+            value = unquoted
+    elif " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+    return key, value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv() -> None:
+    """
+    Load the .env file once per process rather than on every client instantiation.
+
+    Handles the subset of the format used for configuration: ``KEY=value`` lines,
+    optionally prefixed with ``export``, with single- or double-quoted values and
+    ``#`` comments. Double-quoted values support the ``\\"``, ``\\\\``, ``\\n``
+    and ``\\t`` escapes. Variables already set in the environment are not overridden.
+    """
+    path = _find_dotenv()
+    if path is None:
+        return
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            parsed = _parse_dotenv_line(line)
+            if parsed is not None:
+                os.environ.setdefault(*parsed)
+
+
+def _loads(status_code: int, content: bytes) -> Dict[str, Any]:
+    """
+    Decode a JSON response body.
+    
+    Uses orjson on the raw bytes when it is installed, which avoids decoding
+    the body to ``str`` first and is considerably faster on large payloads
+    such as full time series or news feeds. Falls back to the stdlib parser.
+    
+    Raises:
+        APIError: If the body is not valid JSON, e.g. a maintenance or proxy page
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except ValueError as e:
+        logger.error("Invalid JSON response - %s", str(e))
+        raise APIError(status_code, f"Invalid JSON response: {str(e)}")
+
+
+def _build_url(base_url: str, params: Dict[str, Any]) -> str:
+    """Encode the query string up front so the HTTP client does not re-walk the params dict."""
+    separator = "&" if "?" in base_url else "?"
+    return f"{base_url}{separator}{urlencode(params)}"
+
+
+def _log_request(function: str, params: Dict[str, Any]) -> None:
+    """Log an outgoing request with the API key masked, skipping the work when INFO is disabled."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Making API request - Function: %s, Params: %s", function, {**params, "apikey": "***"})
+
+
+def _read_csv(status_code: int, content: bytes) -> "pa.Table":
+    """
+    Parse a CSV response body into an Arrow table using pyarrow's multithreaded reader.
+    
+    Raises:
+        APIError: If the body is not CSV, e.g. an empty body or a maintenance or proxy page
+    """
+    if content.lstrip().startswith(b"<"):
+        logger.error("Invalid CSV response - got markup instead")
+        raise APIError(status_code, "Invalid CSV response: body is HTML/XML")
+    try:
+        return pyarrow.csv.read_csv(pyarrow.BufferReader(content))
+    except pyarrow.ArrowInvalid as e:
+        logger.error("Invalid CSV response - %s", str(e))
+        raise APIError(status_code, f"Invalid CSV response: {str(e)}")
+
+
+def _check_csv_support(params: Dict[str, Any]) -> None:
+    """Raise before any request is made if CSV output is requested without pyarrow."""
+    if params.get("datatype") == "csv" and pyarrow is None:
+        raise InvalidParameterError(
+            "datatype='csv' requires pyarrow. Install it with: pip install pyarrow"
+        )
+
+
+def _build_model(model: Type[BaseModel], status_code: int, content: bytes) -> BaseModel:
+    """
+    Validate a response body into a model.
+    
+    Raises:
+        APIError: If the body is an API error rather than model data, or is not JSON
+        RateLimitError: If the API reports that rate limits are exceeded
+        ValidationError: If the body does not match the model
+    """
+    try:
+        return model.model_validate_json(content)
+    except ValidationError:
+        data = _loads(status_code, content)
+        _check_payload(status_code, data)
+        # Formatting is deferred by the logger, so large payloads cost nothing unless DEBUG is on
+        logger.debug("%s parse failed; payload=%r", model.__name__, data)
+        raise
+
+
+def _decode_response(
+    status_code: int,
+    content: bytes,
+    datatype: Optional[str] = None,
+    response_type: Optional[Type[BaseModel]] = None
+) -> Any:
+    """
+    Decode a response body and check it for API errors.
+    
+    When a response model is given, the body is validated straight from JSON bytes
+    by pydantic-core, without building an intermediate dict. Error payloads never
+    match the model, so the error checks only run when validation fails.
+    
+    CSV requests are parsed into an Arrow table. Alpha Vantage still answers errors
+    for CSV requests with a JSON body, so those go through the JSON path.
+    
+    Raises:
+        APIError: If the API returns an error message or the body is not valid JSON/CSV
+        RateLimitError: If the API reports that rate limits are exceeded
+        ValidationError: If the body does not match the response model
+    """
+    if response_type is not None:
+        return _build_model(response_type, status_code, content)
+    if datatype == "csv" and not content.lstrip().startswith(b"{"):
+        return _read_csv(status_code, content)
+    data = _loads(status_code, content)
+    _check_payload(status_code, data)
+    return data
+
+
+def _check_payload(status_code: int, data: Dict[str, Any]) -> None:
+    """
+    Raise if a decoded response body carries an Alpha Vantage error.
+    
+    Raises:
+        APIError: If the API returns an error message
+        RateLimitError: If the API reports that rate limits are exceeded
+    """
+    if "Error Message" in data:
+        logger.error("API returned error - %s", data["Error Message"])
+        raise APIError(status_code, data["Error Message"])
+    
+    if "Note" in data:
+        note = data["Note"]
+        logger.warning("API returned note: %s", note)
+        if "API call frequency" in note:
+            logger.error("Rate limit exceeded")
+            raise RateLimitError(note)
+
+
+def _is_cacheable(data: Any) -> bool:
+    """
+    Tell whether a decoded response carries data worth caching.
 
-class AlphaVantageClient:
+    Throttle, premium and other informational replies come back as 200 responses with
+    a single "Information" or "Note" key. Caching them would keep serving the message
+    for the whole TTL after the API has recovered.
+    """
+    return not (isinstance(data, dict) and ("Information" in data or "Note" in data))
+
+
+class AlphaVantageClient(_EndpointMethods):
     """
     Alpha Vantage API client for accessing various financial data endpoints.
     
     Args:
         api_key (str, optional): Alpha Vantage API key. If not provided, will look for ALPHA_VANTAGE_API_KEY environment variable.
         base_url (str, optional): Base URL for the API. Defaults to the official Alpha Vantage API URL.
+        cache (FileCache, optional): Cache for API responses. Responses are not cached if not provided.
+        calls_per_minute (int, optional): Client-side limit on calls per minute. None disables it. Defaults to the free tier's 5.
+        calls_per_day (int, optional): Client-side limit on calls per day. None disables it. Defaults to 500.
+        rate_limit_wait (bool, optional): Wait for the limiter if True, raise RateLimitError instead if False.
     """
     
     def __init__(
         self,
         api_key: Optional[str] = None,
-        base_url: str = "https://www.alphavantage.co/query"
+        base_url: str = "https://www.alphavantage.co/query",
+        cache: Optional[FileCache] = None,
+        calls_per_minute: Optional[int] = 5,
+        calls_per_day: Optional[int] = 500,
+        rate_limit_wait: bool = True
     ):
-        load_dotenv()
+        _load_dotenv()
         self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
         if not self.api_key:
             logger.error("No API key provided")
@@ -52,37 +333,65 @@ class AlphaVantageClient:
             )
         self.base_url = base_url
         self.session = requests.Session()
+        # Keep connections alive across calls and retry transient gateway errors. Once
+        # retries run out the last response is returned, so callers see its real status.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+            "Connection": "keep-alive"
+        })
+        self.cache = cache
+        self.rate_limiter = RateLimiter(calls_per_minute, calls_per_day, wait=rate_limit_wait)
         logger.info("AlphaVantage client initialized with base URL: %s", base_url)
 
     def _make_request(
         self,
         function: str,
+        response_type: Optional[Type[BaseModel]] = None,
         **params: Any
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """
         Make a request to the Alpha Vantage API.
         
         Args:
             function: The API function to call
+            response_type: Model to validate the response into, if any
             **params: Additional parameters to pass to the API
             
         Returns:
-            Dict containing the API response
+            Dict containing the API response, an Arrow table for datatype="csv",
+            or an instance of response_type if one is given
             
         Raises:
             APIError: If the API returns an error
             RateLimitError: If API rate limits are exceeded
         """
+        _check_csv_support(params)
         params["function"] = function
         params["apikey"] = self.api_key
         
-        # Log the request (excluding API key)
-        log_params = params.copy()
-        # log_params["apikey"] = "***"
-        logger.info("Making API request - Function: %s, Params: %s", function, log_params)
+        _log_request(function, params)
+        
+        if self.cache is not None:
+            cached = self.cache.get(function, params)
+            if cached is not None:
+                logger.debug("Cache hit - Function: %s", function)
+                return _decode_response(200, cached, params.get("datatype"), response_type)
         
         try:
-            response = self.session.get(self.base_url, params=params)
+            self.rate_limiter.acquire()
+            response = self.session.get(_build_url(self.base_url, params))
             logger.debug("Response status code: %d", response.status_code)
             
             if response.status_code != 200:
@@ -90,29 +399,104 @@ class AlphaVantageClient:
                            response.status_code, response.text)
                 raise APIError(response.status_code, response.text)
                 
-            data = response.json()
-            
-            # Check for error messages in the response
-            if "Error Message" in data:
-                logger.error("API returned error - %s", data["Error Message"])
-                raise APIError(response.status_code, data["Error Message"])
-            
-            if "Note" in data:
-                note = data["Note"]
-                logger.warning("API returned note: %s", note)
-                if "API call frequency" in note:
-                    logger.error("Rate limit exceeded")
-                    raise RateLimitError(note)
+            data = _decode_response(
+                response.status_code, response.content, params.get("datatype"), response_type
+            )
+            if self.cache is not None and _is_cacheable(data):
+                self.cache.set(function, params, response.content)
             
-            logger.info("API request successful - Function: %s", function)
-            logger.debug("Response data: %s", data)
+            logger.debug("API request successful - Function: %s", function)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %s", data)
             return data
             
         except requests.exceptions.RequestException as e:
             logger.error("Request failed - %s", str(e))
             raise APIError(500, f"Request failed: {str(e)}")
 
-    # Stock Time Series APIs
+    def _stream_request(
+        self,
+        function: str,
+        series_key: str,
+        **params: Any
+    ) -> SeriesRows:
+        """
+        Make a streaming request and lazily yield the rows of a time series.
+        
+        The body is parsed incrementally with ijson while it is downloaded, so only
+        one row is materialized at a time instead of the whole response. Streamed
+        responses bypass the cache.
+        
+        Args:
+            function: The API function to call
+            series_key: Top-level key holding the time series, e.g. "Time Series (Daily)"
+            **params: Additional parameters to pass to the API
+            
+        Returns:
+            Iterator of (date, row) tuples in the order returned by the API
+        """
+        if ijson is None:
+            raise InvalidParameterError(
+                "stream=True requires ijson. Install it with: pip install ijson"
+            )
+        if params.get("datatype", "json") != "json":
+            raise InvalidParameterError("stream=True is only supported for datatype='json'")
+        params["function"] = function
+        params["apikey"] = self.api_key
+        return self._iter_series(series_key, params)
+
+    def _iter_series(
+        self,
+        series_key: str,
+        params: Dict[str, Any]
+    ) -> SeriesRows:
+        """Generator behind _stream_request; the request is sent on first iteration."""
+        _log_request(params["function"], params)
+        try:
+            self.rate_limiter.acquire()
+            with self.session.get(_build_url(self.base_url, params), stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("API request failed - Status: %d, Response: %s",
+                               response.status_code, response.text)
+                    raise APIError(response.status_code, response.text)
+                
+                # Let urllib3 undo any gzip/deflate content encoding as we read
+                response.raw.decode_content = True
+                row_prefix = None
+                row = None
+                field = None
+                found_series = False
+                for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                    if row is not None:
+                        if event == "map_key":
+                            field = value
+                        elif event == "end_map":
+                            yield row_prefix[len(series_key) + 1:], row
+                            row = None
+                        else:
+                            row[field] = value
+                    elif event == "start_map" and prefix.startswith(series_key + "."):
+                        row_prefix = prefix
+                        row = {}
+                    elif event == "start_map" and prefix == series_key:
+                        found_series = True
+                    elif event == "string" and prefix in ("Error Message", "Note"):
+                        _check_payload(response.status_code, {prefix: value})
+                    elif event == "string" and prefix == "Information":
+                        # Throttle and premium-only replies carry no series at all
+                        logger.error("API returned information - %s", value)
+                        raise APIError(response.status_code, value)
+                
+                if not found_series:
+                    logger.error("Response did not contain %r", series_key)
+                    raise APIError(response.status_code, f"Response did not contain {series_key!r}")
+                        
+        except requests.exceptions.RequestException as e:
+            logger.error("Request failed - %s", str(e))
+            raise APIError(500, f"Request failed: {str(e)}")
+
+    # Endpoints with fixed parameter handling are generated from _ENDPOINTS at the
+    # bottom of this module; only those needing custom logic are written out here.
     def get_time_series_intraday(
         self,
         symbol: str,
@@ -122,7 +506,7 @@ class AlphaVantageClient:
         month: Optional[str] = None,
         outputsize: str = "compact",
         datatype: str = "json"
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], "pa.Table"]:
         """
         Get intraday time series of the equity specified.
         
@@ -136,10 +520,14 @@ class AlphaVantageClient:
             datatype: Output format (json/csv)
             
         Returns:
-            Dict containing the intraday time series
+            Dict containing the intraday time series, or an Arrow table for datatype="csv"
         """
-        if interval not in ["1min", "5min", "15min", "30min", "60min"]:
+        if interval not in _INTRADAY_INTERVALS:
             raise InvalidParameterError(f"Invalid interval: {interval}")
+        if outputsize not in _OUTPUT_SIZES:
+            raise InvalidParameterError(f"Invalid outputsize: {outputsize}")
+        if datatype not in _DATATYPES:
+            raise InvalidParameterError(f"Invalid datatype: {datatype}")
             
         params = {
             "symbol": symbol,
@@ -156,499 +544,165 @@ class AlphaVantageClient:
         
         return self._make_request("TIME_SERIES_INTRADAY", **params)
 
-    def get_time_series_daily(
+    # Multi-symbol APIs
+    def _map_symbols(
         self,
-        symbol: str,
-        outputsize: str = "compact",
-        datatype: str = "json"
+        method: Callable[..., Any],
+        symbols: List[str],
+        max_workers: int,
+        **kwargs: Any
     ) -> Dict[str, Any]:
         """
-        Get daily time series of the equity specified.
+        Call an endpoint method for each symbol on a thread pool.
         
-        Args:
-            symbol: The stock symbol
-            outputsize: Output size (compact/full)
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing the daily time series
-        """
-        return self._make_request(
-            "TIME_SERIES_DAILY",
-            symbol=symbol,
-            outputsize=outputsize,
-            datatype=datatype
-        )
-
-    def get_time_series_daily_adjusted(
-        self,
-        symbol: str,
-        outputsize: str = "compact",
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get daily adjusted time series of the equity specified.
+        The work is I/O-bound, so threads overlap the network waits. Every worker goes
+        through the client's rate limiter, so throughput is capped by it rather than
+        by the pool size.
         
         Args:
-            symbol: The stock symbol
-            outputsize: Output size (compact/full)
-            datatype: Output format (json/csv)
+            method: Bound endpoint method taking the symbol as first argument
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
+            **kwargs: Additional arguments passed to every call
             
         Returns:
-            Dict containing the daily adjusted time series
+            Dict mapping each symbol to its result
         """
-        return self._make_request(
-            "TIME_SERIES_DAILY_ADJUSTED",
-            symbol=symbol,
-            outputsize=outputsize,
-            datatype=datatype
-        )
+        # Materialize first: the symbols are walked twice, so a generator would come back empty
+        symbols = list(symbols)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda symbol: method(symbol, **kwargs), symbols)
+            return dict(zip(symbols, results))
 
-    def get_time_series_weekly(
+    def get_company_overview_many(
         self,
-        symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, CompanyOverview]:
         """
-        Get weekly time series of the equity specified.
+        Get the company overview for several equities concurrently.
         
         Args:
-            symbol: The stock symbol
-            datatype: Output format (json/csv)
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            Dict containing the weekly time series
+            Dict mapping each symbol to its CompanyOverview
         """
-        return self._make_request(
-            "TIME_SERIES_WEEKLY",
-            symbol=symbol,
-            datatype=datatype
-        )
+        return self._map_symbols(self.get_company_overview, symbols, max_workers)
 
-    def get_time_series_weekly_adjusted(
+    def get_income_statement_many(
         self,
-        symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, IncomeStatement]:
         """
-        Get weekly adjusted time series of the equity specified.
+        Get the income statements for several companies concurrently.
         
         Args:
-            symbol: The stock symbol
-            datatype: Output format (json/csv)
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            Dict containing the weekly adjusted time series
+            Dict mapping each symbol to its IncomeStatement
         """
-        return self._make_request(
-            "TIME_SERIES_WEEKLY_ADJUSTED",
-            symbol=symbol,
-            datatype=datatype
-        )
+        return self._map_symbols(self.get_income_statement, symbols, max_workers)
 
-    def get_time_series_monthly(
+    def get_balance_sheet_many(
         self,
-        symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, BalanceSheet]:
         """
-        Get monthly time series of the equity specified.
+        Get the balance sheets for several companies concurrently.
         
         Args:
-            symbol: The stock symbol
-            datatype: Output format (json/csv)
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            Dict containing the monthly time series
+            Dict mapping each symbol to its BalanceSheet
         """
-        return self._make_request(
-            "TIME_SERIES_MONTHLY",
-            symbol=symbol,
-            datatype=datatype
-        )
+        return self._map_symbols(self.get_balance_sheet, symbols, max_workers)
 
-    def get_time_series_monthly_adjusted(
+    def get_cash_flow_many(
         self,
-        symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, CashFlow]:
         """
-        Get monthly adjusted time series of the equity specified.
+        Get the cash flows for several companies concurrently.
         
         Args:
-            symbol: The stock symbol
-            datatype: Output format (json/csv)
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            Dict containing the monthly adjusted time series
+            Dict mapping each symbol to its CashFlow
         """
-        return self._make_request(
-            "TIME_SERIES_MONTHLY_ADJUSTED",
-            symbol=symbol,
-            datatype=datatype
-        )
+        return self._map_symbols(self.get_cash_flow, symbols, max_workers)
 
-    # Fundamental Data APIs
-    def get_company_overview(
+    def get_earnings_many(
         self,
-        symbol: str
-    ) -> CompanyOverview:
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, Earnings]:
         """
-        Get the company information, financial ratios, and other key metrics for the equity specified.
+        Get the earnings for several companies concurrently.
         
         Args:
-            symbol: The stock symbol
+            symbols: The stock symbols
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            CompanyOverview object containing company overview data
+            Dict mapping each symbol to its Earnings
         """
-        data = self._make_request(
-            "OVERVIEW",
-            symbol=symbol
-        )
-        try:
-            return CompanyOverview(**data)
-        except Exception as e:
-            print("Debug - API Response:")
-            pprint(data)
-            raise
+        return self._map_symbols(self.get_earnings, symbols, max_workers)
 
-    def get_income_statement(
+    def get_time_series_daily_many(
         self,
-        symbol: str
-    ) -> IncomeStatement:
-        """
-        Get the annual and quarterly income statements for the company specified.
-        
-        Args:
-            symbol: The stock symbol
-            
-        Returns:
-            IncomeStatement object containing income statement data
-        """
-        data = self._make_request(
-            "INCOME_STATEMENT",
-            symbol=symbol
-        )
-        return IncomeStatement(**data)
-
-    def get_balance_sheet(
-        self,
-        symbol: str
-    ) -> BalanceSheet:
-        """
-        Get the annual and quarterly balance sheets for the company specified.
-        
-        Args:
-            symbol: The stock symbol
-            
-        Returns:
-            BalanceSheet object containing balance sheet data
-        """
-        data = self._make_request(
-            "BALANCE_SHEET",
-            symbol=symbol
-        )
-        return BalanceSheet(**data)
-
-    def get_cash_flow(
-        self,
-        symbol: str
-    ) -> CashFlow:
-        """
-        Get the annual and quarterly cash flows for the company specified.
-        
-        Args:
-            symbol: The stock symbol
-            
-        Returns:
-            CashFlow object containing cash flow data
-        """
-        data = self._make_request(
-            "CASH_FLOW",
-            symbol=symbol
-        )
-        return CashFlow(**data)
-
-    def get_earnings(
-        self,
-        symbol: str
-    ) -> Earnings:
-        """
-        Get the annual and quarterly earnings for the company specified.
-        
-        Args:
-            symbol: The stock symbol
-            
-        Returns:
-            Earnings object containing earnings data
-        """
-        data = self._make_request(
-            "EARNINGS",
-            symbol=symbol
-        )
-        return Earnings(**data)
-
-    def get_news_sentiment(
-        self,
-        tickers: Optional[str] = None,
-        topics: Optional[str] = None,
-        time_from: Optional[str] = None,
-        time_to: Optional[str] = None,
-        sort: str = "LATEST",
-        limit: int = 50
-    ) -> NewsSentimentResponse:
-        """
-        Get news and sentiment data for symbols or topics.
-        
-        Args:
-            tickers: Comma-separated list of tickers
-            topics: Comma-separated list of topics
-            time_from: Start time (YYYYMMDDTHHMM format)
-            time_to: End time (YYYYMMDDTHHMM format)
-            sort: Sort order (LATEST, EARLIEST, RELEVANCE)
-            limit: Number of results (1-1000)
-            
-        Returns:
-            NewsSentimentResponse object containing news and sentiment data
-        """
-        params = {"sort": sort, "limit": limit}
-        if tickers:
-            params["tickers"] = tickers
-        if topics:
-            params["topics"] = topics
-        if time_from:
-            params["time_from"] = time_from
-        if time_to:
-            params["time_to"] = time_to
-            
-        data = self._make_request("NEWS_SENTIMENT", **params)
-        return NewsSentimentResponse(**data)
-
-    def get_top_gainers_losers(self) -> TopGainersLosers:
-        """
-        Get top gainers, losers, and most actively traded stocks.
-        
-        Returns:
-            TopGainersLosers object containing market movers data
-        """
-        data = self._make_request("TOP_GAINERS_LOSERS")
-        return TopGainersLosers(**data)
-
-    # Forex APIs
-    def get_forex_intraday(
-        self,
-        from_symbol: str,
-        to_symbol: str,
-        interval: str = "5min",
+        symbols: List[str],
         outputsize: str = "compact",
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
+        datatype: str = "json",
+        max_workers: int = 8
+    ) -> Dict[str, Union[Dict[str, Any], "pa.Table"]]:
         """
-        Get intraday forex data.
+        Get the daily time series for several equities concurrently.
         
         Args:
-            from_symbol: The currency to convert from
-            to_symbol: The currency to convert to
-            interval: Time interval (1min, 5min, 15min, 30min, 60min)
+            symbols: The stock symbols
             outputsize: Output size (compact/full)
             datatype: Output format (json/csv)
+            max_workers: Maximum number of concurrent requests
             
         Returns:
-            Dict containing forex data
+            Dict mapping each symbol to its daily time series
         """
-        if interval not in ["1min", "5min", "15min", "30min", "60min"]:
-            raise InvalidParameterError(f"Invalid interval: {interval}")
-            
-        return self._make_request(
-            "FX_INTRADAY",
-            from_symbol=from_symbol,
-            to_symbol=to_symbol,
-            interval=interval,
+        return self._map_symbols(
+            self.get_time_series_daily,
+            symbols,
+            max_workers,
             outputsize=outputsize,
             datatype=datatype
         )
 
-    def get_forex_daily(
-        self,
-        from_symbol: str,
-        to_symbol: str,
-        outputsize: str = "compact",
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get daily forex data.
-        
-        Args:
-            from_symbol: The currency to convert from
-            to_symbol: The currency to convert to
-            outputsize: Output size (compact/full)
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing forex data
-        """
-        return self._make_request(
-            "FX_DAILY",
-            from_symbol=from_symbol,
-            to_symbol=to_symbol,
-            outputsize=outputsize,
-            datatype=datatype
-        )
-
-    def get_forex_weekly(
-        self,
-        from_symbol: str,
-        to_symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get weekly forex data.
-        
-        Args:
-            from_symbol: The currency to convert from
-            to_symbol: The currency to convert to
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing forex data
-        """
-        return self._make_request(
-            "FX_WEEKLY",
-            from_symbol=from_symbol,
-            to_symbol=to_symbol,
-            datatype=datatype
-        )
 
-    def get_forex_monthly(
-        self,
-        from_symbol: str,
-        to_symbol: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get monthly forex data.
-        
-        Args:
-            from_symbol: The currency to convert from
-            to_symbol: The currency to convert to
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing forex data
-        """
-        return self._make_request(
-            "FX_MONTHLY",
-            from_symbol=from_symbol,
-            to_symbol=to_symbol,
-            datatype=datatype
-        )
+def _endpoint_method(name: str, spec: EndpointSpec) -> Callable[..., Any]:
+    """Create the client method for an entry of the endpoint table."""
+    signature = endpoint_signature(spec, stream=spec.stream_key is not None)
 
-    # Crypto APIs
-    def get_crypto_intraday(
-        self,
-        symbol: str,
-        market: str,
-        interval: str = "5min",
-        outputsize: str = "compact",
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get intraday cryptocurrency data.
-        
-        Args:
-            symbol: The cryptocurrency symbol
-            market: The market to get data from
-            interval: Time interval (1min, 5min, 15min, 30min, 60min)
-            outputsize: Output size (compact/full)
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing cryptocurrency data
-        """
-        if interval not in ["1min", "5min", "15min", "30min", "60min"]:
-            raise InvalidParameterError(f"Invalid interval: {interval}")
-            
-        return self._make_request(
-            "CRYPTO_INTRADAY",
-            symbol=symbol,
-            market=market,
-            interval=interval,
-            outputsize=outputsize,
-            datatype=datatype
-        )
+    def method(self: AlphaVantageClient, *args: Any, **kwargs: Any) -> Any:
+        params = bind_params(signature, (self, *args), kwargs)
+        if params.pop("stream", False):
+            return self._stream_request(spec.function, spec.stream_key, **params)
+        return self._make_request(spec.function, response_type=spec.model, **params)
 
-    def get_crypto_daily(
-        self,
-        symbol: str,
-        market: str,
-        outputsize: str = "compact",
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get daily cryptocurrency data.
-        
-        Args:
-            symbol: The cryptocurrency symbol
-            market: The market to get data from
-            outputsize: Output size (compact/full)
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing cryptocurrency data
-        """
-        return self._make_request(
-            "DIGITAL_CURRENCY_DAILY",
-            symbol=symbol,
-            market=market,
-            outputsize=outputsize,
-            datatype=datatype
-        )
+    method.__name__ = name
+    method.__qualname__ = f"AlphaVantageClient.{name}"
+    method.__doc__ = endpoint_docstring(spec, signature)
+    method.__signature__ = signature
+    return method
 
-    def get_crypto_weekly(
-        self,
-        symbol: str,
-        market: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get weekly cryptocurrency data.
-        
-        Args:
-            symbol: The cryptocurrency symbol
-            market: The market to get data from
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing cryptocurrency data
-        """
-        return self._make_request(
-            "DIGITAL_CURRENCY_WEEKLY",
-            symbol=symbol,
-            market=market,
-            datatype=datatype
-        )
 
-    def get_crypto_monthly(
-        self,
-        symbol: str,
-        market: str,
-        datatype: str = "json"
-    ) -> Dict[str, Any]:
-        """
-        Get monthly cryptocurrency data.
-        
-        Args:
-            symbol: The cryptocurrency symbol
-            market: The market to get data from
-            datatype: Output format (json/csv)
-            
-        Returns:
-            Dict containing cryptocurrency data
-        """
-        return self._make_request(
-            "DIGITAL_CURRENCY_MONTHLY",
-            symbol=symbol,
-            market=market,
-            datatype=datatype
-        ) 
\ No newline at end of file
+for _name, _spec in _ENDPOINTS.items():
+    setattr(AlphaVantageClient, _name, _endpoint_method(_name, _spec))
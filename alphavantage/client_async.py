@@ -0,0 +1,231 @@
+"""Asynchronous Alpha Vantage API Client implementation."""
+
+import os
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, Union
+from pydantic import BaseModel
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError(
+        "AsyncAlphaVantageClient requires httpx. Install it with: pip install 'httpx[http2]'"
+    )
+
+from .cache import FileCache
+from .client import (
+    _build_url,
+    _check_csv_support,
+    _decode_response,
+    _is_cacheable,
+    _load_dotenv,
+    _log_request,
+    logger,
+)
+from .endpoints import (
+    _DATATYPES,
+    _ENDPOINTS,
+    _INTRADAY_INTERVALS,
+    _OUTPUT_SIZES,
+    EndpointSpec,
+    bind_params,
+    endpoint_docstring,
+    endpoint_signature,
+)
+from .exceptions import APIError, APIKeyError, InvalidParameterError
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ._endpoint_stubs import AsyncEndpoints as _EndpointMethods
+else:
+    # The endpoint methods are attached at the bottom of this module; type checkers
+    # see them through the generated stub instead
+    _EndpointMethods = object
+
+
+class AsyncAlphaVantageClient(_EndpointMethods):
+    """
+    Asynchronous Alpha Vantage API client built on ``httpx.AsyncClient``.
+    
+    Mirrors :class:`AlphaVantageClient`, but every endpoint method is a coroutine so that
+    requests for many symbols can be overlapped with ``asyncio.gather``:
+    
+        async with AsyncAlphaVantageClient() as client:
+            overviews = await asyncio.gather(
+                *(client.get_company_overview(symbol) for symbol in symbols)
+            )
+    
+    Args:
+        api_key (str, optional): Alpha Vantage API key. If not provided, will look for ALPHA_VANTAGE_API_KEY environment variable.
+        base_url (str, optional): Base URL for the API. Defaults to the official Alpha Vantage API URL.
+        max_connections (int, optional): Maximum number of keep-alive connections kept in the pool.
+        cache (FileCache, optional): Cache for API responses. Responses are not cached if not provided.
+        calls_per_minute (int, optional): Client-side limit on calls per minute. None disables it. Defaults to the free tier's 5.
+        calls_per_day (int, optional): Client-side limit on calls per day. None disables it. Defaults to 500.
+        rate_limit_wait (bool, optional): Wait for the limiter if True, raise RateLimitError instead if False.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://www.alphavantage.co/query",
+        max_connections: int = 20,
+        cache: Optional[FileCache] = None,
+        calls_per_minute: Optional[int] = 5,
+        calls_per_day: Optional[int] = 500,
+        rate_limit_wait: bool = True
+    ):
+        _load_dotenv()
+        self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
+        if not self.api_key:
+            logger.error("No API key provided")
+            raise APIKeyError(
+                "No API key provided. Pass it as argument or set ALPHA_VANTAGE_API_KEY environment variable."
+            )
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=max_connections)
+        )
+        self.cache = cache
+        self.rate_limiter = RateLimiter(calls_per_minute, calls_per_day, wait=rate_limit_wait)
+        logger.info("Async AlphaVantage client initialized with base URL: %s", base_url)
+
+    async def __aenter__(self) -> "AsyncAlphaVantageClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def _make_request(
+        self,
+        function: str,
+        response_type: Optional[Type[BaseModel]] = None,
+        **params: Any
+    ) -> Any:
+        """
+        Make a request to the Alpha Vantage API.
+        
+        Args:
+            function: The API function to call
+            response_type: Model to validate the response into, if any
+            **params: Additional parameters to pass to the API
+            
+        Returns:
+            Dict containing the API response, an Arrow table for datatype="csv",
+            or an instance of response_type if one is given
+            
+        Raises:
+            APIError: If the API returns an error
+            RateLimitError: If API rate limits are exceeded
+        """
+        _check_csv_support(params)
+        params["function"] = function
+        params["apikey"] = self.api_key
+        
+        _log_request(function, params)
+        
+        if self.cache is not None:
+            cached = self.cache.get(function, params)
+            if cached is not None:
+                logger.debug("Cache hit - Function: %s", function)
+                return _decode_response(200, cached, params.get("datatype"), response_type)
+        
+        try:
+            await self.rate_limiter.acquire_async()
+            response = await self._client.get(_build_url(self.base_url, params))
+            logger.debug("Response status code: %d", response.status_code)
+            
+            if response.status_code != 200:
+                logger.error("API request failed - Status: %d, Response: %s", 
+                           response.status_code, response.text)
+                raise APIError(response.status_code, response.text)
+                
+            data = _decode_response(
+                response.status_code, response.content, params.get("datatype"), response_type
+            )
+            if self.cache is not None and _is_cacheable(data):
+                self.cache.set(function, params, response.content)
+            
+            logger.debug("API request successful - Function: %s", function)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %s", data)
+            return data
+            
+        except httpx.HTTPError as e:
+            logger.error("Request failed - %s", str(e))
+            raise APIError(500, f"Request failed: {str(e)}")
+
+    # Endpoints with fixed parameter handling are generated from _ENDPOINTS at the
+    # bottom of this module; only those needing custom logic are written out here.
+    async def get_time_series_intraday(
+        self,
+        symbol: str,
+        interval: str = "5min",
+        adjusted: bool = True,
+        extended_hours: bool = True,
+        month: Optional[str] = None,
+        outputsize: str = "compact",
+        datatype: str = "json"
+    ) -> Union[Dict[str, Any], "pa.Table"]:
+        """
+        Get intraday time series of the equity specified.
+        
+        Args:
+            symbol: The stock symbol
+            interval: Time interval between two consecutive data points (1min, 5min, 15min, 30min, 60min)
+            adjusted: Output adjusted data
+            extended_hours: Include extended hours data
+            month: A month of data in YYYY-MM format (for premium users)
+            outputsize: Output size (compact/full)
+            datatype: Output format (json/csv)
+            
+        Returns:
+            Dict containing the intraday time series, or an Arrow table for datatype="csv"
+        """
+        if interval not in _INTRADAY_INTERVALS:
+            raise InvalidParameterError(f"Invalid interval: {interval}")
+        if outputsize not in _OUTPUT_SIZES:
+            raise InvalidParameterError(f"Invalid outputsize: {outputsize}")
+        if datatype not in _DATATYPES:
+            raise InvalidParameterError(f"Invalid datatype: {datatype}")
+            
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "adjusted": "true" if adjusted else "false",
+            "extended_hours": "true" if extended_hours else "false",
+            "outputsize": outputsize,
+            "datatype": datatype
+        }
+        
+        if month:
+            params["month"] = month
+            return await self._make_request("TIME_SERIES_INTRADAY_EXTENDED", **params)
+        
+        return await self._make_request("TIME_SERIES_INTRADAY", **params)
+
+
+def _endpoint_method(name: str, spec: EndpointSpec) -> Callable[..., Any]:
+    """Create the coroutine method for an entry of the endpoint table."""
+    signature = endpoint_signature(spec, stream=False)
+
+    async def method(self: AsyncAlphaVantageClient, *args: Any, **kwargs: Any) -> Any:
+        params = bind_params(signature, (self, *args), kwargs)
+        return await self._make_request(spec.function, response_type=spec.model, **params)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncAlphaVantageClient.{name}"
+    method.__doc__ = endpoint_docstring(spec, signature)
+    method.__signature__ = signature
+    return method
+
+
+for _name, _spec in _ENDPOINTS.items():
+    setattr(AsyncAlphaVantageClient, _name, _endpoint_method(_name, _spec))
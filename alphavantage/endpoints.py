@@ -0,0 +1,319 @@
+"""Declarative description of the Alpha Vantage endpoints exposed by the clients."""
+
+import inspect
+from typing import TYPE_CHECKING, Any, Dict, Iterator, NamedTuple, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .exceptions import InvalidParameterError
+from .models import (
+    BalanceSheet,
+    CashFlow,
+    CompanyOverview,
+    Earnings,
+    IncomeStatement,
+    NewsSentimentResponse,
+    TopGainersLosers,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Rows yielded by streamed time series: (date, {"1. open": ..., ...})
+SeriesRows = Iterator[Tuple[str, Dict[str, Any]]]
+
+# Accepted values for common request parameters
+_INTRADAY_INTERVALS = frozenset({"1min", "5min", "15min", "30min", "60min"})
+_OUTPUT_SIZES = frozenset({"compact", "full"})
+_DATATYPES = frozenset({"json", "csv"})
+
+_PARAM_CHOICES = {
+    "interval": _INTRADAY_INTERVALS,
+    "outputsize": _OUTPUT_SIZES,
+    "datatype": _DATATYPES,
+}
+
+_PARAM_DOCS = {
+    "symbol": "The stock symbol",
+    "market": "The market to get data from",
+    "from_symbol": "The currency to convert from",
+    "to_symbol": "The currency to convert to",
+    "interval": "Time interval (1min, 5min, 15min, 30min, 60min)",
+    "outputsize": "Output size (compact/full)",
+    "datatype": "Output format (json/csv)",
+    "stream": "Parse the response incrementally and yield (date, row) tuples",
+}
+
+
+class EndpointSpec(NamedTuple):
+    """
+    Description of a single API endpoint.
+
+    Args:
+        function: The API function name
+        summary: First line of the generated method's docstring
+        returns: Description of the return value
+        required: Names of required parameters
+        optional: Optional parameters and their defaults. Parameters defaulting to None are only sent when given a non-empty value.
+        model: Model the response is validated into, if any
+        stream_key: Top-level key of the time series, for endpoints that support stream=True
+        param_docs: Parameter descriptions overriding the common ones
+    """
+    function: str
+    summary: str
+    returns: str
+    required: Tuple[str, ...] = ("symbol",)
+    optional: Dict[str, Any] = {}
+    model: Optional[Type[BaseModel]] = None
+    stream_key: Optional[str] = None
+    param_docs: Dict[str, str] = {}
+
+
+_SERIES = {"datatype": "json"}
+_SERIES_WITH_SIZE = {"outputsize": "compact", "datatype": "json"}
+_CRYPTO_DOCS = {"symbol": "The cryptocurrency symbol"}
+
+# Type checkers see these methods through alphavantage/_endpoint_stubs.pyi; run
+# `make stubs` after changing this table
+_ENDPOINTS: Dict[str, EndpointSpec] = {
+    # Stock Time Series APIs
+    "get_time_series_daily": EndpointSpec(
+        "TIME_SERIES_DAILY",
+        "Get daily time series of the equity specified.",
+        "Dict containing the daily time series",
+        optional=_SERIES_WITH_SIZE,
+        stream_key="Time Series (Daily)",
+    ),
+    "get_time_series_daily_adjusted": EndpointSpec(
+        "TIME_SERIES_DAILY_ADJUSTED",
+        "Get daily adjusted time series of the equity specified.",
+        "Dict containing the daily adjusted time series",
+        optional=_SERIES_WITH_SIZE,
+        stream_key="Time Series (Daily)",
+    ),
+    "get_time_series_weekly": EndpointSpec(
+        "TIME_SERIES_WEEKLY",
+        "Get weekly time series of the equity specified.",
+        "Dict containing the weekly time series",
+        optional=_SERIES,
+    ),
+    "get_time_series_weekly_adjusted": EndpointSpec(
+        "TIME_SERIES_WEEKLY_ADJUSTED",
+        "Get weekly adjusted time series of the equity specified.",
+        "Dict containing the weekly adjusted time series",
+        optional=_SERIES,
+    ),
+    "get_time_series_monthly": EndpointSpec(
+        "TIME_SERIES_MONTHLY",
+        "Get monthly time series of the equity specified.",
+        "Dict containing the monthly time series",
+        optional=_SERIES,
+    ),
+    "get_time_series_monthly_adjusted": EndpointSpec(
+        "TIME_SERIES_MONTHLY_ADJUSTED",
+        "Get monthly adjusted time series of the equity specified.",
+        "Dict containing the monthly adjusted time series",
+        optional=_SERIES,
+    ),
+    # Fundamental Data APIs
+    "get_company_overview": EndpointSpec(
+        "OVERVIEW",
+        "Get the company information, financial ratios, and other key metrics for the equity specified.",
+        "CompanyOverview object containing company overview data",
+        model=CompanyOverview,
+    ),
+    "get_income_statement": EndpointSpec(
+        "INCOME_STATEMENT",
+        "Get the annual and quarterly income statements for the company specified.",
+        "IncomeStatement object containing income statement data",
+        model=IncomeStatement,
+    ),
+    "get_balance_sheet": EndpointSpec(
+        "BALANCE_SHEET",
+        "Get the annual and quarterly balance sheets for the company specified.",
+        "BalanceSheet object containing balance sheet data",
+        model=BalanceSheet,
+    ),
+    "get_cash_flow": EndpointSpec(
+        "CASH_FLOW",
+        "Get the annual and quarterly cash flows for the company specified.",
+        "CashFlow object containing cash flow data",
+        model=CashFlow,
+    ),
+    "get_earnings": EndpointSpec(
+        "EARNINGS",
+        "Get the annual and quarterly earnings for the company specified.",
+        "Earnings object containing earnings data",
+        model=Earnings,
+    ),
+    "get_news_sentiment": EndpointSpec(
+        "NEWS_SENTIMENT",
+        "Get news and sentiment data for symbols or topics.",
+        "NewsSentimentResponse object containing news and sentiment data",
+        required=(),
+        optional={
+            "tickers": None,
+            "topics": None,
+            "time_from": None,
+            "time_to": None,
+            "sort": "LATEST",
+            "limit": 50,
+        },
+        model=NewsSentimentResponse,
+        param_docs={
+            "tickers": "Comma-separated list of tickers",
+            "topics": "Comma-separated list of topics",
+            "time_from": "Start time (YYYYMMDDTHHMM format)",
+            "time_to": "End time (YYYYMMDDTHHMM format)",
+            "sort": "Sort order (LATEST, EARLIEST, RELEVANCE)",
+            "limit": "Number of results (1-1000)",
+        },
+    ),
+    "get_top_gainers_losers": EndpointSpec(
+        "TOP_GAINERS_LOSERS",
+        "Get top gainers, losers, and most actively traded stocks.",
+        "TopGainersLosers object containing market movers data",
+        required=(),
+        model=TopGainersLosers,
+    ),
+    # Forex APIs
+    "get_forex_intraday": EndpointSpec(
+        "FX_INTRADAY",
+        "Get intraday forex data.",
+        "Dict containing forex data",
+        required=("from_symbol", "to_symbol"),
+        optional={"interval": "5min", **_SERIES_WITH_SIZE},
+    ),
+    "get_forex_daily": EndpointSpec(
+        "FX_DAILY",
+        "Get daily forex data.",
+        "Dict containing forex data",
+        required=("from_symbol", "to_symbol"),
+        optional=_SERIES_WITH_SIZE,
+        stream_key="Time Series FX (Daily)",
+    ),
+    "get_forex_weekly": EndpointSpec(
+        "FX_WEEKLY",
+        "Get weekly forex data.",
+        "Dict containing forex data",
+        required=("from_symbol", "to_symbol"),
+        optional=_SERIES,
+    ),
+    "get_forex_monthly": EndpointSpec(
+        "FX_MONTHLY",
+        "Get monthly forex data.",
+        "Dict containing forex data",
+        required=("from_symbol", "to_symbol"),
+        optional=_SERIES,
+    ),
+    # Crypto APIs
+    "get_crypto_intraday": EndpointSpec(
+        "CRYPTO_INTRADAY",
+        "Get intraday cryptocurrency data.",
+        "Dict containing cryptocurrency data",
+        required=("symbol", "market"),
+        optional={"interval": "5min", **_SERIES_WITH_SIZE},
+        param_docs=_CRYPTO_DOCS,
+    ),
+    "get_crypto_daily": EndpointSpec(
+        "DIGITAL_CURRENCY_DAILY",
+        "Get daily cryptocurrency data.",
+        "Dict containing cryptocurrency data",
+        required=("symbol", "market"),
+        optional=_SERIES_WITH_SIZE,
+        stream_key="Time Series (Digital Currency Daily)",
+        param_docs=_CRYPTO_DOCS,
+    ),
+    "get_crypto_weekly": EndpointSpec(
+        "DIGITAL_CURRENCY_WEEKLY",
+        "Get weekly cryptocurrency data.",
+        "Dict containing cryptocurrency data",
+        required=("symbol", "market"),
+        optional=_SERIES,
+        param_docs=_CRYPTO_DOCS,
+    ),
+    "get_crypto_monthly": EndpointSpec(
+        "DIGITAL_CURRENCY_MONTHLY",
+        "Get monthly cryptocurrency data.",
+        "Dict containing cryptocurrency data",
+        required=("symbol", "market"),
+        optional=_SERIES,
+        param_docs=_CRYPTO_DOCS,
+    ),
+}
+
+
+def validate_choices(params: Dict[str, Any]) -> None:
+    """
+    Check parameters with a fixed set of accepted values.
+
+    Raises:
+        InvalidParameterError: If a parameter has an unsupported value
+    """
+    for name, value in params.items():
+        choices = _PARAM_CHOICES.get(name)
+        if choices is not None and value not in choices:
+            raise InvalidParameterError(f"Invalid {name}: {value}")
+
+
+def endpoint_signature(spec: EndpointSpec, stream: bool) -> inspect.Signature:
+    """Build the public signature of the method generated for an endpoint."""
+    kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+    parameters = [inspect.Parameter("self", kind)]
+    parameters += [inspect.Parameter(name, kind, annotation=str) for name in spec.required]
+    for name, default in spec.optional.items():
+        annotation = Optional[str] if default is None else type(default)
+        parameters.append(inspect.Parameter(name, kind, default=default, annotation=annotation))
+    if stream:
+        parameters.append(inspect.Parameter("stream", kind, default=False, annotation=bool))
+
+    if spec.model is not None:
+        return_annotation = spec.model
+    elif stream:
+        return_annotation = Union[Dict[str, Any], "pa.Table", SeriesRows]
+    else:
+        return_annotation = Union[Dict[str, Any], "pa.Table"]
+    return inspect.Signature(parameters, return_annotation=return_annotation)
+
+
+def endpoint_docstring(spec: EndpointSpec, signature: inspect.Signature) -> str:
+    """Build the docstring of the method generated for an endpoint, in the style of the hand-written ones."""
+    lines = [spec.summary, ""]
+    names = [name for name in signature.parameters if name != "self"]
+    if names:
+        lines.append("Args:")
+        for name in names:
+            lines.append(f"    {name}: {spec.param_docs.get(name) or _PARAM_DOCS[name]}")
+        lines.append("")
+
+    returns = spec.returns
+    if "datatype" in spec.optional:
+        if "stream" in signature.parameters:
+            returns += ', an Arrow table for datatype="csv",\n    or an iterator of (date, row) tuples if stream is True'
+        else:
+            returns += ', or an Arrow table for datatype="csv"'
+    lines += ["Returns:", f"    {returns}"]
+    return "\n".join(lines)
+
+
+def bind_params(signature: inspect.Signature, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bind a call to a generated method and turn it into request parameters.
+
+    Optional parameters that default to None are dropped when left empty (None or
+    any falsy value, e.g. ``tickers=""``), matching the API's own defaults.
+
+    Raises:
+        TypeError: If the arguments do not match the signature
+        InvalidParameterError: If a parameter has an unsupported value
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    parameters = signature.parameters
+    params = {
+        name: value for name, value in bound.arguments.items()
+        if value or (value is not None and parameters[name].default is not None)
+    }
+    del params["self"]
+    validate_choices(params)
+    return params
@@ -1,11 +1,140 @@
 """Models for Alpha Vantage API responses."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from .exceptions import InvalidParameterError
 
-class CompanyOverview(BaseModel):
+if TYPE_CHECKING:
+    import pandas as pd
+
+_ModelT = TypeVar("_ModelT", bound="_AVBase")
+
+
+@lru_cache(maxsize=2048)
+def _parse_avts(value: str) -> datetime:
+    """
+    Parse an Alpha Vantage timestamp in the format YYYYMMDDTHHMMSS.
+
+    Feeds repeat publication times across items, and datetimes are immutable, so results
+    are cached.
+
+    Raises:
+        ValueError: If the timestamp is not in the expected format
+    """
+    # Fixed-width format, so slicing is much cheaper than strptime
+    # int() would also accept signs, spaces and underscores, so require plain digits
+    if len(value) != 15 or value[8] != "T" or not (value[:8].isdigit() and value[9:].isdigit()):
+        raise ValueError(f"Invalid timestamp format: {value}")
+    try:
+        return datetime(
+            int(value[0:4]), int(value[4:6]), int(value[6:8]),
+            int(value[9:11]), int(value[11:13]), int(value[13:15])
+        )
+    except ValueError:
+        raise ValueError(f"Invalid timestamp format: {value}")
+
+
+class _AVBase(BaseModel):
+    """Base for all response models, sharing a single model configuration."""
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    # Built once per model by __pydantic_init_subclass__, for from_trusted
+    _ALIAS_TO_ATTR: ClassVar[Dict[str, str]] = {}
+    _NESTED_MODELS: ClassVar[Dict[str, Type["_AVBase"]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._ALIAS_TO_ATTR = {
+            field.alias: name for name, field in cls.model_fields.items() if field.alias
+        }
+        cls._NESTED_MODELS = {}
+        for name, field in cls.model_fields.items():
+            if get_origin(field.annotation) is list:
+                (item,) = get_args(field.annotation)
+                if isinstance(item, type) and issubclass(item, _AVBase):
+                    cls._NESTED_MODELS[name] = item
+
+    @classmethod
+    def from_trusted(cls: Type[_ModelT], raw: Dict[str, Any]) -> _ModelT:
+        """
+        Build a model from already-validated data without running validation.
+
+        Keys may be aliases or field names, and lists of nested models are built the same
+        way. Values are used as-is, so this is only for data that already has the field
+        types, such as the output of model_dump(by_alias=True) that was stored earlier.
+        Raw API payloads, which encode numbers as strings, must go through validation.
+
+        Args:
+            raw: The model data
+
+        Returns:
+            The model instance
+        """
+        values = {}
+        for key, value in raw.items():
+            if value == "None":
+                continue
+            name = cls._ALIAS_TO_ATTR.get(key, key)
+            item_model = cls._NESTED_MODELS.get(name)
+            if item_model is not None:
+                value = [item_model.from_trusted(item) for item in value]
+            values[name] = value
+        return cls.model_construct(**values)
+
+
+class _AVRecord(_AVBase):
+    """Base for models parsed from Alpha Vantage records, which use the string "None" for missing values."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _strip_none_strings(cls, data):
+        """Convert 'None' strings to None for all fields in a single pass over the input."""
+        if isinstance(data, dict):
+            return {k: (None if v == "None" else v) for k, v in data.items()}
+        return data
+
+
+class _AVStatement(_AVBase):
+    """Base for financial statements made of annual and quarterly reports."""
+
+    def to_dataframe(self, period: str = "annual") -> "pd.DataFrame":
+        """
+        Get the reports of one period as a DataFrame, one row per fiscal period.
+
+        Columns are the report fields, so ratios and growth rates can be computed on whole
+        columns instead of looping over the report objects. Requires pandas.
+
+        Args:
+            period (str, optional): "annual" or "quarterly". Defaults to "annual".
+
+        Returns:
+            DataFrame indexed by fiscal_date_ending
+
+        Raises:
+            InvalidParameterError: If period is not "annual" or "quarterly"
+            ImportError: If pandas is not installed
+        """
+        if period not in ("annual", "quarterly"):
+            raise InvalidParameterError(f"Invalid period: {period}")
+        # Imported here so that importing the client does not load pandas
+        import pandas as pd
+
+        field = f"{period}_reports"
+        item_fields = self._NESTED_MODELS[field].model_fields
+        reports = getattr(self, field)
+        frame = pd.DataFrame.from_records([report.__dict__ for report in reports], columns=list(item_fields))
+        # Columns that are missing in every report would otherwise come out as object dtype
+        float_columns = {
+            name: "float64" for name, info in item_fields.items() if info.annotation == Optional[float]
+        }
+        return frame.astype(float_columns).set_index("fiscal_date_ending")
+
+
+class CompanyOverview(_AVRecord):
     """Company overview information."""
     symbol: str = Field(..., alias="Symbol")
     asset_type: str = Field(..., alias="AssetType")
@@ -54,23 +183,8 @@ class CompanyOverview(BaseModel):
     dividend_date: str = Field(..., alias="DividendDate")
     ex_dividend_date: str = Field(..., alias="ExDividendDate")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
 
-
-class IncomeStatementItem(BaseModel):
+class IncomeStatementItem(_AVRecord):
     """Individual income statement entry."""
     fiscal_date_ending: str = Field(..., alias="fiscalDateEnding")
     reported_currency: str = Field(..., alias="reportedCurrency")
@@ -99,34 +213,15 @@ class IncomeStatementItem(BaseModel):
     ebitda: Optional[float] = Field(None, alias="ebitda")
     net_income: Optional[float] = Field(None, alias="netIncome")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
-
-
-class IncomeStatement(BaseModel):
+class IncomeStatement(_AVStatement):
     """Complete income statement response."""
     symbol: str
     annual_reports: List[IncomeStatementItem] = Field(..., alias="annualReports")
     quarterly_reports: List[IncomeStatementItem] = Field(..., alias="quarterlyReports")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
 
-
-class BalanceSheetItem(BaseModel):
+class BalanceSheetItem(_AVRecord):
     """Individual balance sheet entry."""
     fiscal_date_ending: str = Field(..., alias="fiscalDateEnding")
     reported_currency: str = Field(..., alias="reportedCurrency")
@@ -167,34 +262,15 @@ class BalanceSheetItem(BaseModel):
     common_stock: Optional[float] = Field(None, alias="commonStock")
     common_stock_shares_outstanding: Optional[float] = Field(None, alias="commonStockSharesOutstanding")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
 
-
-class BalanceSheet(BaseModel):
+class BalanceSheet(_AVStatement):
     """Complete balance sheet response."""
     symbol: str
     annual_reports: List[BalanceSheetItem] = Field(..., alias="annualReports")
     quarterly_reports: List[BalanceSheetItem] = Field(..., alias="quarterlyReports")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-
 
-class CashFlowItem(BaseModel):
+class CashFlowItem(_AVRecord):
     """Individual cash flow statement entry."""
     fiscal_date_ending: str = Field(..., alias="fiscalDateEnding")
     reported_currency: str = Field(..., alias="reportedCurrency")
@@ -226,34 +302,15 @@ class CashFlowItem(BaseModel):
     change_in_exchange_rate: Optional[float] = Field(None, alias="changeInExchangeRate")
     net_income: Optional[float] = Field(None, alias="netIncome")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
 
-
-class CashFlow(BaseModel):
+class CashFlow(_AVStatement):
     """Complete cash flow statement response."""
     symbol: str
     annual_reports: List[CashFlowItem] = Field(..., alias="annualReports")
     quarterly_reports: List[CashFlowItem] = Field(..., alias="quarterlyReports")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-
 
-class EarningsItem(BaseModel):
+class EarningsItem(_AVRecord):
     """Individual earnings report."""
     fiscal_date_ending: str = Field(..., alias="fiscalDateEnding")
     reported_eps: Optional[float] = Field(None, alias="reportedEPS")
@@ -263,34 +320,15 @@ class EarningsItem(BaseModel):
     surprise_percentage: Optional[float] = Field(None, alias="surprisePercentage")
     report_time: Optional[str] = Field(None, alias="reportTime")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
-
 
-class Earnings(BaseModel):
+class Earnings(_AVBase):
     """Complete earnings response."""
     symbol: str
     annual_earnings: List[EarningsItem] = Field(..., alias="annualEarnings")
     quarterly_earnings: List[EarningsItem] = Field(..., alias="quarterlyEarnings")
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
 
-
-class NewsSentiment(BaseModel):
+class NewsSentiment(_AVRecord):
     """News sentiment item."""
     title: str
     url: str
@@ -311,41 +349,19 @@ class NewsSentiment(BaseModel):
     def parse_timestamp(cls, v: str) -> datetime:
         """Parse the timestamp from format YYYYMMDDTHHMMSS to datetime."""
         if isinstance(v, str):
-            try:
-                return datetime.strptime(v, "%Y%m%dT%H%M%S")
-            except ValueError:
-                raise ValueError(f"Invalid timestamp format: {v}")
-        return v
-
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v)
-        }
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
+            return _parse_avts(v)
         return v
 
 
-class NewsSentimentResponse(BaseModel):
+class NewsSentimentResponse(_AVBase):
     """Complete news sentiment response."""
     items: str = Field(..., alias="items")
     sentiment_score_definition: str = Field(..., alias="sentiment_score_definition")
     relevance_score_definition: str = Field(..., alias="relevance_score_definition")
     feed: List[NewsSentiment]
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
 
-
-class TopGainerLoser(BaseModel):
+class TopGainerLoser(_AVRecord):
     """Individual top gainer/loser entry."""
     ticker: str
     price: Optional[float] = Field(None)
@@ -359,36 +375,16 @@ class TopGainerLoser(BaseModel):
         """Parse percentage string by removing '%' symbol."""
         if isinstance(v, str):
             try:
-                return float(v.rstrip('%'))
+                return float(v[:-1] if v.endswith('%') else v)
             except ValueError:
                 raise ValueError(f"Invalid percentage format: {v}")
         return v
 
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True
-        json_encoders = {
-            float: lambda v: None if v is None else float(v),
-            int: lambda v: None if v is None else int(v)
-        }
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_none_str(cls, v):
-        """Convert 'None' strings to None for all fields."""
-        if v == "None":
-            return None
-        return v
-
-
-class TopGainersLosers(BaseModel):
+class TopGainersLosers(_AVBase):
     """Complete top gainers/losers response."""
     metadata: str
     last_updated: str = Field(..., alias="last_updated")
     top_gainers: List[TopGainerLoser] = Field(..., alias="top_gainers")
     top_losers: List[TopGainerLoser] = Field(..., alias="top_losers")
     most_actively_traded: List[TopGainerLoser] = Field(..., alias="most_actively_traded")
-
-    class Config:
-        """Pydantic model configuration."""
-        populate_by_name = True 
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""Client-side rate limiting for the Alpha Vantage API client."""
+
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+from .exceptions import RateLimitError
+
+
+class _TokenBucket:
+    """Token bucket holding up to ``capacity`` calls, refilled evenly over ``period`` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available."""
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter enforcing per-minute and per-day call limits.
+
+    Tokens are taken before a request is sent, so excess calls wait locally instead of
+    spending a round trip only to be rejected by Alpha Vantage. The limiter is thread-safe
+    and can be shared between clients using the same API key.
+
+    Args:
+        calls_per_minute (int, optional): Maximum calls per minute. None disables the limit.
+        calls_per_day (int, optional): Maximum calls per day. None disables the limit.
+        wait (bool, optional): Block until a call is allowed if True, raise RateLimitError if False.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: Optional[int] = 5,
+        calls_per_day: Optional[int] = 500,
+        wait: bool = True
+    ):
+        self.wait = wait
+        self._buckets: List[_TokenBucket] = []
+        if calls_per_minute:
+            self._buckets.append(_TokenBucket(calls_per_minute, 60))
+        if calls_per_day:
+            self._buckets.append(_TokenBucket(calls_per_day, 24 * 60 * 60))
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from every bucket.
+
+        Returns:
+            Seconds the caller has to wait before sending the request
+
+        Raises:
+            RateLimitError: If no token is available and the limiter does not wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.refill(now)
+            delay = max((bucket.delay() for bucket in self._buckets), default=0.0)
+            if delay > 0 and not self.wait:
+                raise RateLimitError(
+                    f"Client-side rate limit reached, next call allowed in {delay:.1f}s"
+                )
+            # Buckets may go negative, which queues later callers behind this one
+            for bucket in self._buckets:
+                bucket.tokens -= 1
+            return delay
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a call is allowed."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
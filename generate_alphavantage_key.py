@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 """
 Script to automatically generate Alpha Vantage API keys.
-This script provides a Flask server with endpoints to generate and manage API keys.
+This script provides a FastAPI server with endpoints to generate and manage API keys.
 """
 
 import os
+import re
 import random
 import string
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from flask import Flask, jsonify
-import requests
+import orjson
+
+# FastAPI and httpx are imported where they are first used, so scripts that only
+# import generate_api_key don't pay for the web stack at import time
+if TYPE_CHECKING:
+    import httpx
+    from fastapi import FastAPI
 
 # Configure logging
 logging.basicConfig(
@@ -21,18 +28,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+# Matches the key in any of the phrasings Alpha Vantage has used in its response text
+_KEY_RE = re.compile(
+    r'(?:API key|Your API key is|Your dedicated access key is|access key):\s*([A-Za-z0-9]+)'
+)
+
+# Maps every byte value onto a lowercase letter or digit, so a username can be drawn
+# with a single os.urandom call and a C-level bytes.translate
+_USERNAME_ALPHABET = (string.ascii_lowercase + string.digits).encode('ascii')
+_USERNAME_TABLE = bytes(_USERNAME_ALPHABET[b % len(_USERNAME_ALPHABET)] for b in range(256))
+
+_EMAIL_DOMAINS = ('gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com')
+
+# Private generator, so email generation doesn't touch the shared module-level one
+_RNG = random.Random()
+
+# Shared across requests so connections (and TLS sessions) to alphavantage.co are reused
+_client: Optional["httpx.AsyncClient"] = None
+
+def get_client() -> "httpx.AsyncClient":
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            timeout=30.0
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 def generate_random_email() -> str:
     """Generate a random email for API key registration."""
-    username_length = random.randint(6, 12)
-    username = ''.join(random.choices(string.ascii_lowercase + string.digits, k=username_length))
-    year = random.randint(1980, 2000)
-    domains = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
-    domain = random.choice(domains)
+    # One draw covers the username length, the year and the domain
+    bits = _RNG.getrandbits(24)
+    username_length = 6 + (bits & 0xFF) % 7
+    username = os.urandom(username_length).translate(_USERNAME_TABLE).decode('ascii')
+    year = 1980 + (bits >> 8 & 0xFF) % 21
+    domain = _EMAIL_DOMAINS[(bits >> 16) % len(_EMAIL_DOMAINS)]
     return f"{username}+{year}@{domain}"
 
-def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
+async def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
     """
     Generate a new Alpha Vantage API key.
     
@@ -41,6 +85,9 @@ def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
         If successful, api_key will contain the key and error will be None.
         If failed, api_key will be None and error will contain the error message.
     """
+    import httpx
+
+    client = get_client()
     url = "https://www.alphavantage.co/create_post/"
     email = generate_random_email()
     
@@ -49,10 +96,11 @@ def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
     
     # Get CSRF token first
     try:
-        session = requests.Session()
         support_url = "https://www.alphavantage.co/support/"
-        session.get(support_url)
-        csrf_token = session.cookies.get('csrftoken')
+        support_response = await client.get(support_url)
+        # Read the token from this response rather than the shared cookie jar, which
+        # concurrent requests would overwrite
+        csrf_token = support_response.cookies.get('csrftoken')
         logger.debug("CSRF token: %s", csrf_token)
         
         if not csrf_token:
@@ -66,7 +114,8 @@ def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
             'origin': 'https://www.alphavantage.co',
             'referer': 'https://www.alphavantage.co/support/',
             'x-requested-with': 'XMLHttpRequest',
-            'x-csrftoken': csrf_token
+            'x-csrftoken': csrf_token,
+            'cookie': f'csrftoken={csrf_token}'
         }
         
         data = {
@@ -78,24 +127,15 @@ def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
             'email_text': email
         }
         
-        response = session.post(url, headers=headers, data=data)
+        response = await client.post(url, headers=headers, data=data)
         response.raise_for_status()
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         
         if 'text' in response_data:
-            # Try different patterns to extract API key
-            patterns = [
-                'API key: ',
-                'Your API key is: ',
-                'Your dedicated access key is: ',
-                'access key: '
-            ]
-            
-            for pattern in patterns:
-                if pattern in response_data['text']:
-                    api_key = response_data['text'].split(pattern)[1].split('.')[0].strip()
-                    logger.info("Successfully generated API key")
-                    return api_key, None
+            match = _KEY_RE.search(response_data['text'])
+            if match:
+                logger.info("Successfully generated API key")
+                return match.group(1), None
             
             logger.error("Could not find API key in response")
             return None, "Could not find API key in response"
@@ -103,50 +143,75 @@ def generate_api_key() -> Tuple[Optional[str], Optional[str]]:
             logger.error("Invalid response format from Alpha Vantage")
             return None, "Invalid response format"
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Network error: %s", str(e))
         return None, f"Network error: {str(e)}"
     except Exception as e:
         logger.error("Unexpected error: %s", str(e))
         return None, f"Unexpected error: {str(e)}"
 
-@app.route('/api/token', methods=['GET'])
-def get_token():
-    """API endpoint to get a new Alpha Vantage API key."""
-    api_key, error = generate_api_key()
-    
-    if api_key:
-        response = {
-            'success': True,
-            'api_key': api_key,
-            'generated_at': datetime.utcnow().isoformat(),
-            'message': 'API key generated successfully'
-        }
-        logger.info("API key generated successfully")
-        return jsonify(response)
-    else:
-        response = {
-            'success': False,
-            'error': error,
-            'message': 'Failed to generate API key'
+def create_app() -> "FastAPI":
+    """
+    Create the FastAPI application serving the key generator.
+
+    Can also be served with ``uvicorn generate_alphavantage_key:create_app --factory``.
+    """
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Close the shared HTTP client when the server shuts down."""
+        yield
+        await close_client()
+
+    app = FastAPI(
+        title="Alpha Vantage API Key Generator",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
+    )
+
+    @app.get('/api/token')
+    async def get_token():
+        """API endpoint to get a new Alpha Vantage API key."""
+        api_key, error = await generate_api_key()
+
+        if api_key:
+            response = {
+                'success': True,
+                'api_key': api_key,
+                'generated_at': datetime.utcnow().isoformat(),
+                'message': 'API key generated successfully'
+            }
+            logger.info("API key generated successfully")
+            return response
+        else:
+            response = {
+                'success': False,
+                'error': error,
+                'message': 'Failed to generate API key'
+            }
+            logger.error("Failed to generate API key: %s", error)
+            return ORJSONResponse(response, status_code=500)
+
+    @app.get('/health')
+    async def health_check():
+        """Health check endpoint."""
+        return {
+            'status': 'healthy',
+            'timestamp': datetime.utcnow().isoformat()
         }
-        logger.error("Failed to generate API key: %s", error)
-        return jsonify(response), 500
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat()
-    })
+    return app
 
 if __name__ == '__main__':
+    import uvicorn
+
     port = int(os.environ.get('PORT', 7785))
-    debug = os.environ.get('FLASK_ENV') == 'development'
+    debug = os.environ.get('APP_ENV', os.environ.get('FLASK_ENV')) == 'development'
     
     logger.info("Starting Alpha Vantage API Key Generator server...")
     logger.info("Port: %d", port)
     logger.info("Debug mode: %s", "enabled" if debug else "disabled")
     
-    app.run(host='0.0.0.0', port=port, debug=debug) 
\ No newline at end of file
+    uvicorn.run(create_app(), host='0.0.0.0', port=port, log_level="debug" if debug else "info") 
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Generate alphavantage/_endpoint_stubs.pyi from the endpoint table.
+
+The endpoint methods are attached to the clients at import time, so type checkers
+cannot see them. The clients inherit the classes declared in the generated stub while
+type checking instead. Run ``make stubs`` after changing ``_ENDPOINTS``; with
+``--check`` the script only verifies that the committed stub is up to date.
+"""
+
+import inspect
+import os
+import sys
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUB_PATH = os.path.join(ROOT, "alphavantage", "_endpoint_stubs.pyi")
+
+sys.path.insert(0, ROOT)
+
+from alphavantage.endpoints import _ENDPOINTS, EndpointSpec, endpoint_signature  # noqa: E402
+
+HEADER = '''"""
+Declarations of the endpoint methods generated from ``_ENDPOINTS``, for type checkers.
+
+Generated by scripts/generate_endpoint_stubs.py; do not edit, run ``make stubs``.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+import pyarrow as pa
+
+from .endpoints import SeriesRows
+from .models import (
+{models}
+)
+'''
+
+
+def _annotation(parameter: inspect.Parameter) -> str:
+    if parameter.default is inspect.Parameter.empty:
+        return "str"
+    if parameter.default is None:
+        return "Optional[str]"
+    return type(parameter.default).__name__
+
+
+def _method(name: str, spec: EndpointSpec, is_async: bool) -> str:
+    signature = endpoint_signature(spec, stream=spec.stream_key is not None and not is_async)
+    params = []
+    for parameter in signature.parameters.values():
+        if parameter.name == "self":
+            params.append("self")
+        elif parameter.default is inspect.Parameter.empty:
+            params.append(f"{parameter.name}: {_annotation(parameter)}")
+        else:
+            default = f'"{parameter.default}"' if isinstance(parameter.default, str) else repr(parameter.default)
+            params.append(f"{parameter.name}: {_annotation(parameter)} = {default}")
+
+    if spec.model is not None:
+        returns = spec.model.__name__
+    elif "stream" in signature.parameters:
+        returns = "Union[Dict[str, Any], pa.Table, SeriesRows]"
+    else:
+        returns = "Union[Dict[str, Any], pa.Table]"
+    prefix = "async def" if is_async else "def"
+    return f"    {prefix} {name}({', '.join(params)}) -> {returns}: ..."
+
+
+def render() -> str:
+    """Render the stub module for the current endpoint table."""
+    models = sorted({spec.model.__name__ for spec in _ENDPOINTS.values() if spec.model is not None})
+    lines: List[str] = [HEADER.format(models="\n".join(f"    {model}," for model in models))]
+    for class_name, is_async in (("SyncEndpoints", False), ("AsyncEndpoints", True)):
+        lines.append("")
+        lines.append(f"class {class_name}:")
+        lines.extend(_method(name, spec, is_async) for name, spec in _ENDPOINTS.items())
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str]) -> int:
+    stub = render()
+    relpath = os.path.relpath(STUB_PATH, ROOT)
+    if "--check" in argv:
+        with open(STUB_PATH, encoding="utf-8") as fh:
+            if fh.read() != stub:
+                print(f"{relpath} is out of date with _ENDPOINTS, run 'make stubs'")
+                return 1
+        return 0
+    with open(STUB_PATH, "w", encoding="utf-8") as fh:
+        fh.write(stub)
+    print(f"Wrote {relpath}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
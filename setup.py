@@ -1,35 +0,0 @@
-from setuptools import setup, find_packages
-
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-setup(
-    name="alphavantage-api",
-    version="0.1.0",
-    author="Alpha Vantage API Client Contributors",
-    author_email="",
-    description="A Python client for the Alpha Vantage API with type-safe response parsing",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yourusername/alphavantage-api",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Office/Business :: Financial",
-    ],
-    python_requires=">=3.8",
-    install_requires=[
-        "requests>=2.31.0",
-        "python-dotenv>=1.0.0",
-        "pydantic>=2.5.0",
-    ],
-) 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Shared fixtures for the test suite."""
+
+import io
+from unittest import mock
+
+import pytest
+
+from alphavantage import AlphaVantageClient
+
+
+@pytest.fixture
+def client():
+    """Client with the rate limits disabled and a mocked session."""
+    av = AlphaVantageClient(api_key="test", calls_per_minute=None, calls_per_day=None)
+    av.session = mock.MagicMock()
+    return av
+
+
+@pytest.fixture
+def respond(client):
+    """Make the mocked session answer every request with the given body."""
+    def respond(body: bytes, status_code: int = 200) -> mock.MagicMock:
+        response = mock.MagicMock()
+        response.status_code = status_code
+        response.content = body
+        response.text = body.decode("utf-8", "replace")
+        # Read by the streaming path, which also uses the response as a context manager
+        response.raw = io.BytesIO(body)
+        response.__enter__.return_value = response
+        client.session.get.return_value = response
+        return response
+    return respond
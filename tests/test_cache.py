@@ -0,0 +1,57 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+
+from alphavantage import FileCache
+
+
+def test_round_trip(tmp_path):
+    cache = FileCache(str(tmp_path))
+    params = {"symbol": "IBM", "apikey": "a"}
+    assert cache.get("OVERVIEW", params) is None
+    cache.set("OVERVIEW", params, b'{"Symbol": "IBM"}')
+    assert cache.get("OVERVIEW", params) == b'{"Symbol": "IBM"}'
+    assert cache.get("OVERVIEW", {"symbol": "MSFT", "apikey": "a"}) is None
+
+
+def test_api_key_is_not_part_of_the_key(tmp_path):
+    cache = FileCache(str(tmp_path))
+    cache.set("OVERVIEW", {"symbol": "IBM", "apikey": "a"}, b"{}")
+    assert cache.get("OVERVIEW", {"symbol": "IBM", "apikey": "b"}) == b"{}"
+    assert cache.get("OVERVIEW", {"apikey": "b", "symbol": "IBM"}) == b"{}"
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = FileCache(str(tmp_path), ttls={"OVERVIEW": 60})
+    params = {"symbol": "IBM"}
+    cache.set("OVERVIEW", params, b"{}")
+    path = cache._path("OVERVIEW", params)
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    assert cache.get("OVERVIEW", params) is None
+
+
+def test_ttls():
+    cache = FileCache(ttls={"GLOBAL_QUOTE": 10})
+    assert cache.ttl_for("OVERVIEW") == 24 * 60 * 60
+    assert cache.ttl_for("GLOBAL_QUOTE") == 10
+    assert cache.ttl_for("TIME_SERIES_INTRADAY") == 5 * 60
+    assert cache.ttl_for("FX_DAILY") == 60 * 60
+    assert cache.ttl_for("SYMBOL_SEARCH") is None
+
+
+def test_functions_without_ttl_are_not_stored(tmp_path):
+    cache = FileCache(str(tmp_path))
+    cache.set("SYMBOL_SEARCH", {"keywords": "IBM"}, b"{}")
+    assert cache.get("SYMBOL_SEARCH", {"keywords": "IBM"}) is None
+    assert not os.listdir(tmp_path)
+
+
+def test_clear(tmp_path):
+    cache = FileCache(str(tmp_path))
+    cache.set("OVERVIEW", {"symbol": "IBM"}, b"{}")
+    cache.set("EARNINGS", {"symbol": "IBM"}, b"{}")
+    cache.clear()
+    assert cache.get("OVERVIEW", {"symbol": "IBM"}) is None
+    assert cache.get("EARNINGS", {"symbol": "IBM"}) is None
@@ -0,0 +1,72 @@
+"""Tests for the request path of the synchronous client."""
+
+import pytest
+
+from alphavantage import AlphaVantageClient, APIError, APIKeyError, FileCache, RateLimitError
+from alphavantage.client import _load_dotenv
+
+
+def test_missing_api_key(monkeypatch, tmp_path):
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+    monkeypatch.chdir(tmp_path)
+    _load_dotenv.cache_clear()
+    try:
+        with pytest.raises(APIKeyError):
+            AlphaVantageClient()
+    finally:
+        _load_dotenv.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "body, status_code, error",
+    [
+        (b'{"Error Message": "Invalid API call."}', 200, APIError),
+        (b'{"Note": "Our standard API call frequency is 5 calls per minute."}', 200, RateLimitError),
+        (b"<html>Service Unavailable</html>", 200, APIError),
+        (b"Bad Gateway", 502, APIError),
+    ],
+)
+def test_errors(client, respond, body, status_code, error):
+    respond(body, status_code)
+    with pytest.raises(error):
+        client.get_time_series_daily("IBM")
+
+
+def test_responses_are_cached(client, respond, tmp_path):
+    client.cache = FileCache(str(tmp_path))
+    respond(b'{"Time Series (Daily)": {}}')
+    first = client.get_time_series_daily("IBM")
+    second = client.get_time_series_daily("IBM")
+    assert first == second == {"Time Series (Daily)": {}}
+    assert client.session.get.call_count == 1
+
+
+def test_information_replies_are_not_cached(client, respond, tmp_path):
+    client.cache = FileCache(str(tmp_path))
+    respond(b'{"Information": "Thank you for using Alpha Vantage!"}')
+    client.get_time_series_daily("IBM")
+    client.get_time_series_daily("IBM")
+    assert client.session.get.call_count == 2
+
+
+def test_csv(client, respond):
+    pytest.importorskip("pyarrow")
+    respond(b"timestamp,open,close\n2024-01-03,161.0,160.1\n2024-01-02,162.8,161.5\n")
+    table = client.get_time_series_daily("IBM", datatype="csv")
+    assert table.column_names == ["timestamp", "open", "close"]
+    assert table.num_rows == 2
+
+
+@pytest.mark.parametrize("body", [b"<html>Service Unavailable</html>", b""])
+def test_csv_errors(client, respond, body):
+    pytest.importorskip("pyarrow")
+    respond(body)
+    with pytest.raises(APIError):
+        client.get_time_series_daily("IBM", datatype="csv")
+
+
+def test_csv_error_payload(client, respond):
+    pytest.importorskip("pyarrow")
+    respond(b'{"Error Message": "Invalid API call."}')
+    with pytest.raises(APIError):
+        client.get_time_series_daily("IBM", datatype="csv")
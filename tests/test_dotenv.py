@@ -0,0 +1,77 @@
+"""Tests for the built-in .env parser."""
+
+import os
+
+import pytest
+
+from alphavantage.client import _load_dotenv, _parse_dotenv_line
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("KEY=value", ("KEY", "value")),
+        ("  KEY = value  ", ("KEY", "value")),
+        ("export KEY=value", ("KEY", "value")),
+        ("KEY=", ("KEY", "")),
+        ("KEY=a=b", ("KEY", "a=b")),
+        ("KEY=value # comment", ("KEY", "value")),
+        ("KEY=value#not-a-comment", ("KEY", "value#not-a-comment")),
+        ("KEY='single quoted'", ("KEY", "single quoted")),
+        ('KEY="double quoted"', ("KEY", "double quoted")),
+        ("KEY='a # b' # comment", ("KEY", "a # b")),
+        ('KEY="a # b" # comment', ("KEY", "a # b")),
+        ('KEY="a\\"b"', ("KEY", 'a"b')),
+        ('KEY="a\\\\b"', ("KEY", "a\\b")),
+        ('KEY="a\\\\"', ("KEY", "a\\")),
+        ('KEY="line1\\nline2\\tend"', ("KEY", "line1\nline2\tend")),
+        ('KEY="C:\\path"', ("KEY", "C:\\path")),
+        ("KEY='a\\\"b'", ("KEY", 'a\\"b')),
+        ('KEY="unterminated', ("KEY", '"unterminated')),
+    ],
+)
+def test_parse_line(line, expected):
+    assert _parse_dotenv_line(line) == expected
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# comment", "NO_EQUALS_SIGN", "=value"])
+def test_parse_line_ignored(line):
+    assert _parse_dotenv_line(line) is None
+
+
+@pytest.fixture
+def dotenv_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _load_dotenv.cache_clear()
+    yield tmp_path
+    _load_dotenv.cache_clear()
+
+
+def test_load_dotenv_sets_missing_variables(dotenv_dir, monkeypatch):
+    monkeypatch.delenv("AV_TEST_NEW", raising=False)
+    monkeypatch.setenv("AV_TEST_EXISTING", "from-env")
+    (dotenv_dir / ".env").write_text(
+        '# settings\nAV_TEST_NEW="from \\"file\\""\nAV_TEST_EXISTING=from-file\n',
+        encoding="utf-8",
+    )
+
+    _load_dotenv()
+    try:
+        assert os.environ["AV_TEST_NEW"] == 'from "file"'
+        assert os.environ["AV_TEST_EXISTING"] == "from-env"
+    finally:
+        os.environ.pop("AV_TEST_NEW", None)
+
+
+def test_load_dotenv_searches_parent_directories(dotenv_dir, monkeypatch):
+    monkeypatch.delenv("AV_TEST_PARENT", raising=False)
+    (dotenv_dir / ".env").write_text("AV_TEST_PARENT=1\n", encoding="utf-8")
+    child = dotenv_dir / "a" / "b"
+    child.mkdir(parents=True)
+    monkeypatch.chdir(child)
+
+    _load_dotenv()
+    try:
+        assert os.environ["AV_TEST_PARENT"] == "1"
+    finally:
+        os.environ.pop("AV_TEST_PARENT", None)
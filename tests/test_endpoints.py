@@ -0,0 +1,74 @@
+"""Tests for the endpoint table and the methods generated from it."""
+
+import inspect
+
+import pytest
+
+from alphavantage import AlphaVantageClient, InvalidParameterError
+from alphavantage.endpoints import _ENDPOINTS, bind_params, endpoint_signature
+
+NEWS = endpoint_signature(_ENDPOINTS["get_news_sentiment"], stream=False)
+DAILY = endpoint_signature(_ENDPOINTS["get_time_series_daily"], stream=True)
+# Stands in for the client instance the generated methods pass as self
+SELF = object()
+
+
+def test_defaults_are_sent():
+    assert bind_params(DAILY, (SELF, "IBM"), {}) == {
+        "symbol": "IBM", "outputsize": "compact", "datatype": "json", "stream": False,
+    }
+
+
+def test_positional_and_keyword_arguments():
+    assert bind_params(DAILY, (SELF, "IBM", "full"), {"datatype": "csv"}) == {
+        "symbol": "IBM", "outputsize": "full", "datatype": "csv", "stream": False,
+    }
+
+
+@pytest.mark.parametrize("empty", [None, ""])
+def test_empty_optionals_defaulting_to_none_are_dropped(empty):
+    assert bind_params(NEWS, (SELF,), {"tickers": empty, "topics": "technology"}) == {
+        "topics": "technology", "sort": "LATEST", "limit": 50,
+    }
+
+
+def test_falsy_values_of_other_optionals_are_kept():
+    assert bind_params(NEWS, (SELF,), {"limit": 0})["limit"] == 0
+
+
+def test_invalid_choice():
+    with pytest.raises(InvalidParameterError):
+        bind_params(DAILY, (SELF, "IBM"), {"outputsize": "huge"})
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [((SELF,), {}), ((SELF, "IBM"), {"bogus": 1}), ((SELF, "IBM", "full", "json", False, 1), {})],
+)
+def test_signature_mismatch(args, kwargs):
+    with pytest.raises(TypeError):
+        bind_params(DAILY, args, kwargs)
+
+
+@pytest.mark.parametrize("name", sorted(_ENDPOINTS))
+def test_generated_methods(name):
+    method = getattr(AlphaVantageClient, name)
+    spec = _ENDPOINTS[name]
+    assert method.__name__ == name
+    assert inspect.signature(method) == endpoint_signature(spec, stream=spec.stream_key is not None)
+    assert method.__doc__.startswith(spec.summary)
+
+
+def test_unbound_call_raises_type_error():
+    with pytest.raises(TypeError):
+        AlphaVantageClient.get_time_series_daily()
+
+
+def test_request(client, respond):
+    respond(b'{"Time Series (Daily)": {}}')
+    assert client.get_time_series_daily("IBM") == {"Time Series (Daily)": {}}
+    url = client.session.get.call_args[0][0]
+    assert "function=TIME_SERIES_DAILY" in url
+    assert "symbol=IBM" in url
+    assert "apikey=test" in url
+    assert "stream" not in url
@@ -0,0 +1,32 @@
+"""Tests for the response models."""
+
+from datetime import datetime
+
+import pytest
+
+from alphavantage.models import _parse_avts
+
+
+def test_parse_timestamp():
+    assert _parse_avts("20240102T153045") == datetime(2024, 1, 2, 15, 30, 45)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2024-01-02T15:30",
+        "20240102 153045",
+        "20240102T1530",
+        "20240102T15304512",
+        "2024010xT153045",
+        "+2024010T153045",
+        "2024_102T153045",
+        "20240102T+53045",
+        "20241302T153045",
+        "20240102T256000",
+    ],
+)
+def test_parse_timestamp_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        _parse_avts(value)
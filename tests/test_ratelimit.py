@@ -0,0 +1,61 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from alphavantage import RateLimiter, RateLimitError
+
+
+def test_calls_within_the_limit_do_not_wait():
+    limiter = RateLimiter(calls_per_minute=3, calls_per_day=None)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_excess_calls_are_queued():
+    limiter = RateLimiter(calls_per_minute=2, calls_per_day=None)
+    limiter.reserve()
+    limiter.reserve()
+    # One token refills every 30 seconds, and each queued caller waits behind the last
+    assert limiter.reserve() == pytest.approx(30, abs=0.1)
+    assert limiter.reserve() == pytest.approx(60, abs=0.1)
+
+
+def test_strictest_bucket_wins():
+    limiter = RateLimiter(calls_per_minute=10, calls_per_day=1)
+    limiter.reserve()
+    assert limiter.reserve() == pytest.approx(24 * 60 * 60, rel=1e-3)
+
+
+def test_no_wait_raises():
+    limiter = RateLimiter(calls_per_minute=1, calls_per_day=None, wait=False)
+    limiter.reserve()
+    with pytest.raises(RateLimitError):
+        limiter.reserve()
+    # A rejected call does not take a token
+    assert limiter._buckets[0].tokens == pytest.approx(0, abs=0.01)
+
+
+def test_disabled():
+    limiter = RateLimiter(calls_per_minute=None, calls_per_day=None)
+    assert all(limiter.reserve() == 0.0 for _ in range(100))
+
+
+def test_acquire_sleeps_for_the_delay():
+    limiter = RateLimiter(calls_per_minute=1, calls_per_day=None)
+    with mock.patch("alphavantage.ratelimit.time.sleep") as sleep:
+        limiter.acquire()
+        sleep.assert_not_called()
+        limiter.acquire()
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(60, abs=0.1)
+
+
+def test_acquire_async_sleeps_for_the_delay():
+    limiter = RateLimiter(calls_per_minute=1, calls_per_day=None)
+    with mock.patch("alphavantage.ratelimit.asyncio.sleep", new=mock.AsyncMock()) as sleep:
+        asyncio.run(limiter.acquire_async())
+        sleep.assert_not_called()
+        asyncio.run(limiter.acquire_async())
+        sleep.assert_awaited_once()
@@ -0,0 +1,63 @@
+"""Tests for stream=True, which parses time series incrementally with ijson."""
+
+import json
+
+import pytest
+
+from alphavantage import APIError, InvalidParameterError, RateLimitError
+
+pytest.importorskip("ijson")
+
+DAILY = {
+    "Meta Data": {"1. Information": "Daily Prices", "2. Symbol": "IBM"},
+    "Time Series (Daily)": {
+        "2024-01-03": {"1. open": "161.0", "4. close": "160.1", "5. volume": "4086100"},
+        "2024-01-02": {"1. open": "162.8", "4. close": "161.5", "5. volume": "3989244"},
+    },
+}
+
+
+def test_rows(client, respond):
+    respond(json.dumps(DAILY).encode())
+    rows = client.get_time_series_daily("IBM", stream=True)
+    # The request is only sent once iteration starts
+    client.session.get.assert_not_called()
+    assert list(rows) == [
+        ("2024-01-03", {"1. open": "161.0", "4. close": "160.1", "5. volume": "4086100"}),
+        ("2024-01-02", {"1. open": "162.8", "4. close": "161.5", "5. volume": "3989244"}),
+    ]
+    url = client.session.get.call_args[0][0]
+    assert "function=TIME_SERIES_DAILY" in url
+    assert client.session.get.call_args[1] == {"stream": True}
+
+
+def test_empty_series(client, respond):
+    respond(b'{"Meta Data": {}, "Time Series (Daily)": {}}')
+    assert list(client.get_time_series_daily("IBM", stream=True)) == []
+
+
+@pytest.mark.parametrize(
+    "body, error",
+    [
+        (b'{"Information": "Thank you for using Alpha Vantage!"}', APIError),
+        (b'{"Error Message": "Invalid API call."}', APIError),
+        (b'{"Note": "Our standard API call frequency is 5 calls per minute."}', RateLimitError),
+        (b'{"Meta Data": {}}', APIError),
+    ],
+)
+def test_errors(client, respond, body, error):
+    respond(body)
+    with pytest.raises(error):
+        list(client.get_time_series_daily("IBM", stream=True))
+
+
+def test_http_error(client, respond):
+    respond(b"Bad Gateway", status_code=502)
+    with pytest.raises(APIError) as exc_info:
+        list(client.get_time_series_daily("IBM", stream=True))
+    assert exc_info.value.status_code == 502
+
+
+def test_csv_is_rejected(client):
+    with pytest.raises(InvalidParameterError):
+        client.get_time_series_daily("IBM", datatype="csv", stream=True)